@@ -0,0 +1,71 @@
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Where the resolved ChromeDriver path is remembered between runs
+DRIVER_PATH_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'form_tester', 'driver_path')
+_driver_path_lock = threading.Lock()
+
+def get_chromedriver_path(refresh=False):
+    """
+    Resolve the ChromeDriver executable, installing it only when needed
+    
+    Checks the CHROMEDRIVER_PATH environment variable and then the on-disk
+    cache; ChromeDriverManager is only consulted when neither points at an
+    existing file, or when a refresh is requested.
+    
+    :param refresh: Ignore cached locations and ask ChromeDriverManager again
+    :return: Path to the ChromeDriver executable
+    """
+    if not refresh:
+        env_path = os.environ.get('CHROMEDRIVER_PATH')
+        if env_path and os.path.exists(env_path):
+            return env_path
+    
+    # Serialize so browsers starting together in this process don't install concurrently
+    with _driver_path_lock:
+        if not refresh:
+            try:
+                with open(DRIVER_PATH_CACHE, 'r', encoding='utf-8') as f:
+                    cached_path = f.read().strip()
+                if cached_path and os.path.exists(cached_path):
+                    os.environ['CHROMEDRIVER_PATH'] = cached_path
+                    return cached_path
+            except OSError:
+                pass
+        
+        from webdriver_manager.chrome import ChromeDriverManager
+        driver_path = ChromeDriverManager().install()
+        
+        try:
+            os.makedirs(os.path.dirname(DRIVER_PATH_CACHE), exist_ok=True)
+            with open(DRIVER_PATH_CACHE, 'w', encoding='utf-8') as f:
+                f.write(driver_path)
+        except OSError as e:
+            logger.warning("Could not cache ChromeDriver path: %s", e)
+        
+        # Let later calls in this process skip the cache file
+        os.environ['CHROMEDRIVER_PATH'] = driver_path
+        return driver_path
+
+# Page resources Chrome won't download; none of them affect form field XPaths
+BLOCKED_RESOURCES = ('images', 'fonts')
+
+def configure_page_loading(chrome_options, block_stylesheets=False):
+    """
+    Trim what Chrome loads for each page
+    
+    Blocks BLOCKED_RESOURCES and returns from driver.get on DOMContentLoaded;
+    FormInteraction waits for the form itself.
+    
+    :param chrome_options: Chrome Options to update
+    :param block_stylesheets: Also block stylesheets; leave off for sites whose
+                              custom dropdowns, or a person using the browser, need CSS
+    """
+    resources = BLOCKED_RESOURCES + (('stylesheets',) if block_stylesheets else ())
+    chrome_options.add_experimental_option("prefs", {
+        f"profile.managed_default_content_settings.{resource}": 2 for resource in resources
+    })
+    chrome_options.page_load_strategy = 'eager'
@@ -1,24 +1,66 @@
+import atexit
 import json
 import logging
+import logging.handlers
 import sys
 import os
 import time
 import csv
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from urllib.parse import urlparse
 
+from browser_setup import configure_page_loading, get_chromedriver_path
 from form_interaction import FormInteraction
 
-# Configure logging
+# Configure logging; file writes are buffered and flushed in chunks, or immediately on errors
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+file_log_target = logging.FileHandler("form_tester.log")
+file_log_target.setFormatter(logging.Formatter(LOG_FORMAT))
+file_log_handler = logging.handlers.MemoryHandler(
+    1024,
+    flushLevel=logging.ERROR,
+    target=file_log_target
+)
 logging.basicConfig(
     level=logging.INFO, 
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler("form_tester.log"),
+        file_log_handler,
         logging.StreamHandler()
     ]
 )
+atexit.register(file_log_handler.flush)
 logger = logging.getLogger(__name__)
 
+# Browser pool configuration
+POOL_SIZE = 2  # Number of Chrome instances kept warm
+MAX_USES_PER_INSTANCE = 25  # Forms handled before a driver is recycled
+
+# Pages are filled in by hand in these browsers, so they keep their stylesheets unless
+# FORM_TESTER_BLOCK_STYLESHEETS=1 is set
+BLOCK_STYLESHEETS = os.environ.get('FORM_TESTER_BLOCK_STYLESHEETS') == '1'
+
+# Request URL patterns dropped before a connection is opened (trackers, ads, media)
+BLOCKED_URL_PATTERNS = [
+    '*doubleclick*', '*google-analytics*', '*googletagmanager*', '*facebook.net*',
+    '*hotjar*', '*.gif', '*.mp4', '*.woff2'
+]
+
+# User notes output configuration
+OUTPUT_DIR = 'outputs'
+NOTES_CSV_PATH = os.path.join(OUTPUT_DIR, 'user_notes.csv')
+NOTES_FIELDS = ('timestamp', 'url', 'domain', 'user_note')  # Fixed CSV header, in order
+# Rows buffered before they are written out; notes are typed by hand, so write each
+# one at once rather than risk losing a session's worth on a crash
+NOTES_FLUSH_BATCH_SIZE = 1
+
+# Create the output directory once, rather than on every save
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+
 def setup_browser():
     """
     Set up Chrome WebDriver with advanced configuration
@@ -29,7 +71,6 @@ def setup_browser():
         from selenium import webdriver
         from selenium.webdriver.chrome.service import Service
         from selenium.webdriver.chrome.options import Options
-        from webdriver_manager.chrome import ChromeDriverManager
 
         # Chrome options for stability and stealth
         chrome_options = Options()
@@ -39,165 +80,502 @@ def setup_browser():
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--log-level=3")  # Minimal logging
         
+        # Trim browser features that add startup and background work
+        chrome_options.add_argument(
+            "--disable-features=Translate,MediaRouter,OptimizationHints,InterestCohortAPI,PrivacySandboxSettings4"
+        )
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--disable-default-apps")
+        
         # Anti-bot detection options
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option("useAutomationExtension", False)
         
-        # Optional: Run in headless mode (uncomment if needed)
-        # chrome_options.add_argument("--headless")
+        # Skip resources the form filling doesn't need and don't wait on sub-resources
+        configure_page_loading(chrome_options, block_stylesheets=BLOCK_STYLESHEETS)
         
-        # Use WebDriver Manager to handle driver installation
-        service = Service(ChromeDriverManager().install())
+        # Optional: Run in headless mode (uncomment if needed; not useful while taking notes)
+        # chrome_options.add_argument("--headless=new")
         
-        # Create driver with service and options
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        # Reuse a previously installed driver when possible
+        try:
+            driver = webdriver.Chrome(service=Service(get_chromedriver_path()), options=chrome_options)
+        except Exception as e:
+            # The cached driver may no longer match the installed Chrome
+            logger.warning("Cached ChromeDriver failed, reinstalling: %s", e)
+            driver = webdriver.Chrome(service=Service(get_chromedriver_path(refresh=True)), options=chrome_options)
         
         # Additional anti-detection script
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
+        # Block analytics/ad requests at the network layer
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning("Could not set blocked URLs: %s", e)
+        
         return driver
     
     except Exception as e:
-        logger.error(f"Error setting up browser: {e}")
+        logger.error("Error setting up browser: %s", e)
         raise
 
 def load_form_data(file_path):
     """
-    Load form data from JSON file
+    Stream form entries from a JSON file
+    
+    Entries are parsed lazily with ijson when it is installed, so the first
+    form can be processed before the whole file has been read.
     
     :param file_path: Path to the JSON file
-    :return: Parsed JSON data
+    :return: Iterator over form entries
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            try:
+                import ijson
+            except ImportError:
+                # Fall back to parsing the whole file at once
+                yield from json.load(f)
+                return
+            
+            yield from ijson.items(f, 'item', use_float=True)
     except Exception as e:
-        logger.error(f"Error loading form data: {e}")
-        return []
+        logger.error("Error loading form data: %s", e)
 
-def save_user_notes_to_csv(data):
+class CsvNotesSink:
     """
-    Save user notes to a single, persistent CSV file
+    Append-only CSV writer that stays open and flushes rows in batches
     
-    :param data: List of dictionaries containing URL and user notes
+    Use as a context manager; any buffered rows are written on exit.
+    The directory of the target file must already exist.
     """
-    # Create 'outputs' directory if it doesn't exist
-    os.makedirs('outputs', exist_ok=True)
+    def __init__(self, filename=NOTES_CSV_PATH, fieldnames=NOTES_FIELDS, batch_size=NOTES_FLUSH_BATCH_SIZE):
+        """
+        :param filename: Path of the CSV file to append to
+        :param fieldnames: Column names, in order; other keys in a row are ignored
+        :param batch_size: Number of buffered rows that triggers a flush
+        """
+        self.filename = filename
+        self.fieldnames = list(fieldnames)
+        self.batch_size = batch_size
+        self._buffer = deque()
+        self._file = None
+        self._writer = None
+        self._needs_header = False
     
-    # Define the persistent CSV filename
-    filename = 'outputs/user_notes.csv'
+    def __enter__(self):
+        self._file = open(self.filename, 'a', newline='', encoding='utf-8', buffering=1 << 20)
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction='ignore')
+        
+        # Write headers only if the file is new or empty; decided once, not per flush
+        self._needs_header = self._file.tell() == 0
+        return self
     
-    try:
-        # Check if file exists to determine if we need headers
-        file_exists = os.path.exists(filename)
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            self.flush()
+        finally:
+            self._file.close()
+        return False
+    
+    def append(self, row, timestamp=None):
+        """
+        Buffer a row, flushing once the batch is full
         
-        with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
-            # Determine fieldnames dynamically based on the first entry
-            if data:
-                fieldnames = ['timestamp', 'url', 'domain'] + list(data[0].keys() - {'url', 'domain', 'timestamp'})
-                
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                # Write headers only if file didn't exist before
-                if not file_exists:
-                    writer.writeheader()
-                
-                # Write each entry with a timestamp
-                timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-                for entry in data:
-                    full_entry = {
-                        'timestamp': timestamp,
-                        **entry
-                    }
-                    writer.writerow(full_entry)
-        
-        logger.info(f"User notes appended to {filename}")
-        return filename
-    except Exception as e:
-        logger.error(f"Error saving user notes to CSV: {e}")
-        return None
+        :param row: Dictionary with the note columns
+        :param timestamp: Timestamp for the row (defaults to now)
+        """
+        self._buffer.append({
+            'timestamp': timestamp or time.strftime("%Y-%m-%d %H:%M:%S"),
+            **row
+        })
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+    
+    def flush(self):
+        """
+        Write all buffered rows to disk
+        """
+        if not self._buffer:
+            return
+        
+        if self._needs_header:
+            self._writer.writeheader()
+            self._needs_header = False
+        
+        self._writer.writerows(self._buffer)
+        self._file.flush()
+        self._buffer.clear()
 
-def test_forms(json_data, user_data):
+@lru_cache(maxsize=4096)
+def get_domain(url):
     """
-    Test forms with user interaction and note-taking
+    Get the domain of a URL, cached since batches often repeat domains
     
-    :param json_data: List of form entries
-    :param user_data: User data dictionary
-    :return: List of user notes
+    :param url: URL to parse
+    :return: Network location part of the URL
+    """
+    return urlparse(url).netloc
+
+def load_noted_urls(filename=NOTES_CSV_PATH):
+    """
+    Load the URLs that already have notes from a previous run
+    
+    :param filename: Path of the notes CSV file
+    :return: Set of URLs already noted
     """
-    # Setup browser
-    driver = None
-    user_notes = []
+    if not os.path.exists(filename):
+        return set()
     
     try:
+        with open(filename, 'r', newline='', encoding='utf-8') as csvfile:
+            return {row['url'] for row in csv.DictReader(csvfile) if row.get('url')}
+    except Exception as e:
+        logger.error("Error reading existing user notes: %s", e)
+        return set()
+
+class BrowserPool:
+    """
+    Pool of pre-warmed WebDriver instances shared between worker threads
+    """
+    def __init__(self, size=POOL_SIZE, max_uses=MAX_USES_PER_INSTANCE):
+        """
+        Start the pool and launch all of its browsers
+        
+        :param size: Number of drivers to keep warm
+        :param max_uses: Number of forms a driver handles before it is recycled
+        """
+        self.size = size
+        self.max_uses = max_uses
+        self._idle = queue.Queue()
+        self._drivers = {}  # id(driver) -> driver, for every live driver
+        self._uses = {}  # id(driver) -> number of forms handled
+        self._pages = {}  # id(driver) -> (URL requested, URL the browser landed on)
+        self._interactions = {}  # id(driver) -> FormInteraction kept for the driver's lifetime
+        self._lock = threading.Lock()
+        self._closed = False
+        
+        try:
+            for _ in range(size):
+                self._idle.put(self._spawn())
+        except Exception:
+            # Don't leak the browsers that did start; the caller never gets the pool to close
+            self.close()
+            raise
+    
+    def _spawn(self):
+        """
+        Launch a new browser and register it with the pool
+        
+        :return: Configured Selenium WebDriver
+        """
         driver = setup_browser()
+        interaction = FormInteraction(driver)
+        with self._lock:
+            self._drivers[id(driver)] = driver
+            self._uses[id(driver)] = 0
+            self._interactions[id(driver)] = interaction
+        return driver
+    
+    def _retire(self, driver):
+        """
+        Quit a driver and forget about it
+        
+        :param driver: Driver to shut down
+        """
+        with self._lock:
+            self._drivers.pop(id(driver), None)
+            self._uses.pop(id(driver), None)
+            self._pages.pop(id(driver), None)
+            self._interactions.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def page_of(self, driver):
+        """
+        Get the page a driver was last navigated to
+        
+        :param driver: Pooled driver
+        :return: (requested URL, landed URL) tuple, or (None, None)
+        """
+        with self._lock:
+            return self._pages.get(id(driver), (None, None))
+    
+    def interaction_of(self, driver):
+        """
+        Get the FormInteraction bound to a pooled driver
+        
+        Reusing it keeps its element cache across forms on the same browser.
         
-        # Form interaction instance
-        form_interaction = FormInteraction(driver)
+        :param driver: Pooled driver
+        :return: FormInteraction for the driver
+        """
+        with self._lock:
+            return self._interactions[id(driver)]
+    
+    def record_page(self, driver, requested_url, landed_url):
+        """
+        Remember the page a driver was navigated to
         
-        # Process each form entry
+        :param driver: Pooled driver
+        :param requested_url: URL passed to driver.get
+        :param landed_url: URL the browser ended up on after redirects
+        """
+        with self._lock:
+            self._pages[id(driver)] = (requested_url, landed_url)
+    
+    def acquire(self):
+        """
+        Check out an idle driver, blocking until one is returned
+        
+        :return: Selenium WebDriver owned by the caller until released
+        """
+        while True:
+            with self._lock:
+                if self._closed or not self._drivers:
+                    raise RuntimeError("No browsers available in pool")
+            try:
+                return self._idle.get(timeout=1)
+            except queue.Empty:
+                continue
+    
+    def release(self, driver, failed=False):
+        """
+        Return a driver to the pool, recycling it when worn out or broken
+        
+        :param driver: Driver previously obtained from acquire()
+        :param failed: True if the driver raised while processing a form
+        """
+        with self._lock:
+            closed = self._closed
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+        
+        if closed:
+            self._retire(driver)
+            return
+        
+        if failed or uses >= self.max_uses:
+            logger.info("Recycling browser after %s uses (failed=%s)", uses, failed)
+            self._retire(driver)
+            try:
+                driver = self._spawn()
+            except Exception as e:
+                logger.error("Could not replace recycled browser: %s", e)
+                return
+        
+        self._idle.put(driver)
+    
+    def close(self):
+        """
+        Quit every driver in the pool, including ones still checked out
+        """
+        with self._lock:
+            self._closed = True
+            drivers = list(self._drivers.values())
+        for driver in drivers:
+            self._retire(driver)
+
+def prepare_form(pool, driver, form_entry, user_data):
+    """
+    Open a form in a pooled browser and fill it out
+    
+    :param pool: BrowserPool the driver was checked out of
+    :param driver: Driver acquired for this form
+    :param form_entry: Form entry dictionary
+    :param user_data: User data dictionary
+    :return: Driver showing the filled form; the caller must release it
+    """
+    try:
+        url = form_entry['url']
+        requested_url, landed_url = pool.page_of(driver)
+        
+        if url == requested_url and driver.current_url == landed_url:
+            # Still on this page from the previous form; reset it instead of reloading
+            driver.execute_script("document.querySelectorAll('form').forEach(function (f) { f.reset(); });")
+        else:
+            # Navigate to URL
+            driver.get(url)
+            pool.record_page(driver, url, driver.current_url)
+        
+        # Process the form
+        pool.interaction_of(driver).process_form(form_entry, user_data)
+    except Exception:
+        pool.release(driver, failed=True)
+        raise
+    
+    return driver
+
+def put_until_stopped(target_queue, item, stop):
+    """
+    Put an item on a bounded queue, giving up once stop is set
+    
+    :param target_queue: Queue to put the item on
+    :param item: Item to enqueue
+    :param stop: threading.Event signalling that the consumer has gone away
+    :return: True if the item was enqueued
+    """
+    while not stop.is_set():
+        try:
+            target_queue.put(item, timeout=1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def queue_forms(json_data, pool, executor, user_data, noted_urls, ready, stop):
+    """
+    Producer side of test_forms: dispatch usable form entries, in order
+    
+    A driver is acquired for each entry before it is submitted to the
+    executor, and its (index, url, future) is put on the bounded ready queue,
+    so at most a queue's worth of forms is prepared ahead of the note prompt.
+    None is enqueued once input runs out.
+    
+    :param json_data: Iterable of form entries
+    :param pool: BrowserPool used by the workers
+    :param executor: Executor running prepare_form
+    :param user_data: User data dictionary
+    :param noted_urls: URLs to skip because they already have notes
+    :param ready: Bounded queue consumed by test_forms
+    :param stop: threading.Event set when test_forms is finished
+    """
+    try:
         for index, form_entry in enumerate(json_data, 1):
+            # Skip forms with errors or no fields
+            if form_entry.get('error') or not form_entry.get('fields'):
+                logger.warning("Skipping form %s due to error or no fields", index)
+                continue
+            
+            # Get URL
+            url = form_entry.get('url')
+            if not url:
+                logger.warning("No URL found for form %s", index)
+                continue
+            
+            if url in noted_urls:
+                logger.info("Skipping form %s, already noted: %s", index, url)
+                continue
+            
+            # Check a browser out here, in input order, so later forms can never hold
+            # every driver while an earlier one waits for its notes to be taken
             try:
-                # Skip forms with errors or no fields
-                if form_entry.get('error') or not form_entry.get('fields'):
-                    logger.warning(f"Skipping form {index} due to error or no fields")
-                    continue
+                driver = pool.acquire()
+            except RuntimeError:
+                if stop.is_set():
+                    return
+                raise
+            
+            future = executor.submit(prepare_form, pool, driver, form_entry, user_data)
+            if not put_until_stopped(ready, (index, url, future), stop):
+                return
+    except Exception as e:
+        logger.error("Error queueing forms: %s", e)
+    finally:
+        put_until_stopped(ready, None, stop)
+
+def test_forms(json_data, user_data):
+    """
+    Test forms with user interaction and note-taking
+    
+    Forms are opened and filled concurrently across a pool of browsers by a
+    producer thread, while notes are collected one URL at a time, in input
+    order. Each note is handed to the CSV sink as soon as it is taken.
+    
+    :param json_data: Iterable of form entries
+    :param user_data: User data dictionary
+    :return: Number of notes collected
+    """
+    pool = None
+    executor = None
+    stop = threading.Event()
+    notes_count = 0
+    
+    # Resume support: skip URLs noted in an earlier run
+    noted_urls = load_noted_urls()
+    if noted_urls:
+        logger.info("Found notes for %s URLs from a previous run", len(noted_urls))
+    
+    try:
+        # Keep the notes file open for the whole run
+        with CsvNotesSink() as sink:
+            # Setup browsers
+            pool = BrowserPool()
+            executor = ThreadPoolExecutor(max_workers=pool.size)
+            
+            # Prepare forms in the background while the user is taking notes
+            ready = queue.Queue(maxsize=pool.size)
+            producer = threading.Thread(
+                target=queue_forms,
+                args=(json_data, pool, executor, user_data, noted_urls, ready, stop),
+                daemon=True
+            )
+            producer.start()
+            
+            # Collect notes serially, since stdin can't be shared between workers
+            while True:
+                item = ready.get()
+                if item is None:
+                    break
+                index, url, future = item
                 
-                # Get URL
-                url = form_entry.get('url')
-                if not url:
-                    logger.warning(f"No URL found for form {index}")
+                try:
+                    # Log current processing
+                    logger.info("Processing form %s: %s", index, url)
+                    
+                    # Wait for the form to be filled out
+                    driver = future.result()
+                except Exception as e:
+                    logger.error("Error processing form %s: %s", index, e)
                     continue
                 
-                # Log current processing
-                logger.info(f"Processing form {index}/{len(json_data)}: {url}")
-                
-                # Navigate to URL
-                driver.get(url)
-                
-                # Process the form
-                form_interaction.process_form(form_entry, user_data)
-                
-                # Prompt for user input
-                print(f"\n--- URL: {url} ---")
-                print("Fill out the form and then enter any notes about this website.")
-                print("Press Enter when done (leave blank if no notes).")
-                
-                # Wait for user input
-                user_note = input("Your notes: ").strip()
-                
-                # Parse URL for domain
-                parsed_url = urlparse(url)
-                
-                # Collect user notes
-                if user_note or user_note == '':
-                    user_notes.append({
-                        'url': url,
-                        'domain': parsed_url.netloc,
-                        'user_note': user_note
-                    })
+                try:
+                    # Prompt for user input
+                    print(f"\n--- URL: {url} ---")
+                    print("Fill out the form and then enter any notes about this website.")
+                    print("Press Enter when done (leave blank if no notes).")
+                    
+                    # Wait for user input
+                    user_note = input("Your notes: ").strip()
+                    
+                    # Collect user notes
+                    if user_note or user_note == '':
+                        sink.append({
+                            'url': url,
+                            'domain': get_domain(url),
+                            'user_note': user_note
+                        })
+                        notes_count += 1
+                    
+                except Exception as e:
+                    logger.error("Error processing form %s: %s", index, e)
+                    continue
                 
-            except Exception as e:
-                logger.error(f"Error processing form {index}: {e}")
-                continue
+                finally:
+                    # Hand the browser back so the next queued form can use it
+                    pool.release(driver)
+        
+        if notes_count:
+            logger.info("User notes appended to %s", sink.filename)
     
     except Exception as e:
-        logger.critical(f"Critical error in form testing: {e}")
+        logger.critical("Critical error in form testing: %s", e)
     
     finally:
-        # Ensure driver is closed
-        if driver:
-            try:
-                driver.quit()
-            except:
-                pass
-        
-        # Save user notes to CSV
-        if user_notes:
-            save_user_notes_to_csv(user_notes)
+        # Stop the producer, drop queued work and ensure all drivers are closed
+        stop.set()
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if pool:
+            pool.close()
     
-    return user_notes
+    return notes_count
 
 def main():
     """
@@ -216,19 +594,19 @@ def main():
     
     # Validate input file exists
     if not os.path.exists(input_file):
-        logger.error(f"Input file not found: {input_file}")
+        logger.error("Input file not found: %s", input_file)
         sys.exit(1)
     
-    # Load form data
+    # Stream form data
     json_data = load_form_data(input_file)
     
     # Test forms with user interaction
-    user_notes = test_forms(json_data, user_data)
+    notes_count = test_forms(json_data, user_data)
     
     # Print summary
     print("\n--- Testing Complete ---")
-    print(f"Total URLs processed: {len(user_notes)}")
-    print(f"Notes collected for {len(user_notes)} websites")
+    print(f"Total URLs processed: {notes_count}")
+    print(f"Notes collected for {notes_count} websites")
     print("Notes saved in outputs/user_notes.csv")
 
 if __name__ == "__main__":
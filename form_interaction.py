@@ -1,32 +1,493 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
     ElementNotInteractableException,
+    ElementClickInterceptedException,
     StaleElementReferenceException,
-    NoSuchElementException
+    UnexpectedTagNameException
 )
-from selenium.webdriver.common.action_chains import ActionChains
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from types import MappingProxyType
 import logging
+import queue
 import re
 import time
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Pulls the quoted id out of an XPath such as //input[@id='privacy']
+_ID_IN_XPATH = re.compile(r'''id=['"]([^'"]+)['"]''')
+
+# Maximum number of element references kept per FormInteraction
+_ELEMENT_CACHE_SIZE = 128
+
+# Field name mapping for alternate field names (user data key -> names it can fill), read-only
+FIELD_MAPPINGS = MappingProxyType({
+    'Street': ('Street', 'StreetAddress', 'Address', 'AddressLine1', 'addr1'),
+    'StreetAddress': ('Street', 'StreetAddress', 'Address', 'AddressLine1', 'addr1'),
+    'Address': ('Street', 'StreetAddress', 'Address', 'AddressLine1', 'addr1'),
+    'Email': ('Email', 'EmailAddress', 'email_address'),
+    'ConfirmEmail': ('ConfirmEmail', 'EmailConfirm', 'email_confirm', 'verify_email'),
+    'Phone': ('Phone', 'Telephone', 'PhoneNumber', 'phone_number', 'Mobile'),
+    'City': ('City', 'Town', 'city_name'),
+    'Zipcode': ('Zipcode', 'ZipCode', 'PostalCode', 'Zip', 'postal_code', 'zip_code'),
+    'State': ('State', 'Province', 'Region', 'state_province'),
+    'Country': ('Country', 'Nation', 'United States', 'USA', 'US', 'United States of America'),
+    'Brochure': ('Brochure', 'BrochureRequest', 'RequestType', 'request', "Request a Brochure"),
+    'Privacy': ('Privacy', 'PrivacyOption', 'DeliveryMethod', 'ContactPreference', 'Email', 'SendBy'),
+})
+
+# Lowercased alternate name -> user data keys it can take a value from, in FIELD_MAPPINGS order
+_ALIAS_TO_CANONICAL = {}
+for _canonical, _aliases in FIELD_MAPPINGS.items():
+    for _alias in _aliases:
+        _ALIAS_TO_CANONICAL.setdefault(_alias.lower(), []).append(_canonical)
+_ALIAS_TO_CANONICAL = {alias: tuple(keys) for alias, keys in _ALIAS_TO_CANONICAL.items()}
+
+# Flat (lowercased alternate name, user data key) pairs for substring matching
+_LOWER_ALIASES = tuple(
+    (alias.lower(), canonical) for canonical, aliases in FIELD_MAPPINGS.items() for alias in aliases
+)
+
+# (user data key, regex matching any of its lowercased alternate names) pairs, longest
+# name first, for finding an alternate name inside a longer field name
+_ALIAS_PATTERNS = tuple(
+    (canonical, re.compile('|'.join(
+        map(re.escape, sorted({alias.lower() for alias in aliases}, key=len, reverse=True))
+    )))
+    for canonical, aliases in FIELD_MAPPINGS.items()
+)
+
+def _resolve_value(field_name, user_data):
+    """
+    Find the user data value for a form field, directly or via an alternate name
+    
+    :param field_name: Field name from the form entry
+    :param user_data: Dictionary of user data
+    :return: The value to fill, or None if user_data has nothing for this field
+    """
+    # Direct match
+    if field_name in user_data:
+        return user_data[field_name]
+    
+    # Try alternate field names
+    user_key = next((key for key in _ALIAS_TO_CANONICAL.get(field_name.lower(), ()) if key in user_data), None)
+    if user_key is None:
+        return None
+    logger.info("Using %s value for field %s", user_key, field_name)
+    return user_data[user_key]
+
+# In-page equivalent of driver.find_element for the locators built by FormInteraction._locator
+_FIND_JS = """
+function find(by, selector) {
+    if (by === 'id') return document.getElementById(selector);
+    if (by === 'css selector') return document.querySelector(selector);
+    return document.evaluate(selector, document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+"""
+
+# Resolves a batch of [by, selector] locators in-page to [element, lowercased tag name,
+# visible and enabled] triples; missing elements come back as null
+_BATCH_FIND_JS = _FIND_JS + """
+return arguments[0].map(function (locator) {
+    var el = find(locator[0], locator[1]);
+    if (!el) return null;
+    return [el, el.tagName.toLowerCase(), !el.disabled && el.getClientRects().length > 0];
+});
+"""
+
+# Fills a batch of [by, selector, value] triples in-page and reports, per triple, whether
+# it was 'filled', 'missing' (not in the DOM yet), 'skipped' (not a visible, plain text control)
+# or 'rejected' (the page's own handlers changed or dropped the value)
+_BULK_FILL_JS = _FIND_JS + """
+var results = [];
+var skipTypes = ['checkbox', 'radio', 'file', 'submit', 'button', 'image', 'reset', 'hidden'];
+for (var i = 0; i < arguments[0].length; i++) {
+    var el = find(arguments[0][i][0], arguments[0][i][1]);
+    if (!el) { results.push('missing'); continue; }
+    var tag = el.tagName.toLowerCase();
+    var type = (el.type || '').toLowerCase();
+    var isText = tag === 'textarea' || (tag === 'input' && skipTypes.indexOf(type) < 0);
+    // Leave hidden controls (honeypots) to the per-field path, which waits for them to show
+    if (!isText || el.disabled || el.readOnly || el.getClientRects().length === 0) {
+        results.push('skipped');
+        continue;
+    }
+    // Use the native setter so framework-controlled inputs (React etc.) see the change
+    var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+    setter.call(el, arguments[0][i][2]);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    results.push(el.value === arguments[0][i][2] ? 'filled' : 'rejected');
+}
+return results;
+"""
+
+# Selects a <select> option for arguments[1] in-page, trying in order: exact visible text,
+# exact value, partial text, last non-placeholder option, then index 1. Returns null if the
+# element isn't a <select>, false if nothing could be chosen, else {strategy, text}.
+_DROPDOWN_JS = """
+var el = arguments[0];
+var value = arguments[1];
+var lower = value.toLowerCase();
+if (!el || el.tagName.toLowerCase() !== 'select') return null;
+var opts = Array.prototype.filter.call(el.options, function (o) { return !o.disabled; });
+var placeholders = ['select', 'choose', 'pick', '---'];
+function text(o) { return o.text.replace(/\\s+/g, ' ').trim(); }
+function pick(strategy, test) {
+    for (var i = 0; i < opts.length; i++) {
+        if (test(opts[i])) return {option: opts[i], strategy: strategy};
+    }
+    return null;
+}
+var choice = pick('visible text', function (o) { return text(o) === value; })
+    || pick('value', function (o) { return o.value === value; })
+    || pick('partial text match', function (o) { return text(o).toLowerCase().indexOf(lower) >= 0; });
+if (!choice) {
+    for (var i = opts.length - 1; i >= 0; i--) {
+        var t = text(opts[i]);
+        if (t && placeholders.indexOf(t.toLowerCase()) < 0) {
+            choice = {option: opts[i], strategy: 'last valid option fallback'};
+            break;
+        }
+    }
+}
+if (!choice && el.options.length > 1) {
+    choice = {option: el.options[1], strategy: 'index 1'};
+}
+if (!choice) return false;
+// Already showing this option: don't fire change handlers for nothing
+if (el.selectedIndex === choice.option.index) {
+    return {strategy: choice.strategy + ' (already selected)', text: text(choice.option)};
+}
+el.selectedIndex = choice.option.index;
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+return {strategy: choice.strategy, text: text(choice.option)};
+"""
+
+# Returns every element matched by the first CSS selector in arguments[0] that matches
+# anything, or an empty array if none do
+_FIRST_SELECTOR_MATCHES_JS = """
+for (var i = 0; i < arguments[0].length; i++) {
+    var nodes = document.querySelectorAll(arguments[0][i]);
+    if (nodes.length) return Array.prototype.slice.call(nodes);
+}
+return [];
+"""
+
+# Sets a single field's value the same way, in one round-trip, and reports whether it stuck;
+# controls the bulk fill would skip are left untouched and reported as false
+_SET_VALUE_JS = """
+var el = arguments[0];
+var skipTypes = ['checkbox', 'radio', 'file', 'submit', 'button', 'image', 'reset', 'hidden'];
+var tag = el.tagName.toLowerCase();
+var type = (el.type || '').toLowerCase();
+var isText = tag === 'textarea' || (tag === 'input' && skipTypes.indexOf(type) < 0);
+if (!isText || el.disabled || el.readOnly) return false;
+var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+setter.call(el, arguments[1]);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+return el.value === arguments[1];
+"""
+
+# Reports a consent checkbox's type, checked state and whether it was in the viewport,
+# scrolling it into view when it still needs clicking
+_PRIVACY_STATE_JS = """
+var el = arguments[0];
+var r = el.getBoundingClientRect();
+var state = {type: el.type, checked: el.checked, inView: r.top >= 0 && r.bottom <= window.innerHeight};
+if (!(state.type === 'checkbox' && state.checked) && !state.inView) {
+    el.scrollIntoView({block: 'center'});
+}
+return state;
+"""
+
+# Checks a (possibly custom-styled) consent checkbox in-page, trying in order: a click on
+# the input, its label, a styled frame next to it, its parent, a nearby span, and finally
+# setting .checked directly. Returns the name of the strategy that worked, or null.
+_PRIVACY_CLICK_JS = """
+var el = arguments[0];
+function done() { return (el.type || '').toLowerCase() !== 'checkbox' || el.checked; }
+function attempt(target) {
+    if (!target) return false;
+    try { target.click(); } catch (err) { return false; }
+    return done();
+}
+var id = el.id ? CSS.escape(el.id) : null;
+if (attempt(el)) return 'direct click';
+if (id && attempt(document.querySelector('label[for="' + id + '"]'))) return 'label click';
+if (id && attempt(document.querySelector('#' + id + ' + .checkbox-frame, #' + id + ' ~ .nb-checkbox-frame, #'
+        + id + ' + span, #' + id + ' ~ span.checkbox-frame'))) return 'frame click';
+if (attempt(el.parentNode)) return 'parent click';
+if (el.parentNode && attempt(el.parentNode.querySelector('span'))) return 'nearby span click';
+el.checked = true;
+el.dispatchEvent(new Event('change', {bubbles: true}));
+return el.checked ? 'checked property' : null;
+"""
+
+# Field types that usually sit behind input masks or key handlers and need real keystrokes
+_KEYSTROKE_TYPES = ('password', 'tel', 'date', 'contenteditable')
+
 class FormInteraction:
-    def __init__(self, driver, timeout=10):
+    # Common patterns for the items of custom (div/li based) dropdowns, in priority order.
+    # [attr*=...] is the CSS form of XPath's contains(@attr, ...), and CSS selectors
+    # resolve faster than XPath in the browser.
+    _CUSTOM_DROPDOWN_SELECTORS = (
+        "ul[class*='dropdown'] > li",
+        "div[class*='dropdown'] > div",
+        "div[class*='select'] > div",
+        "div[class*='option']",
+        "li[class*='option']",
+        "div[role*='option']"
+    )
+    # Locator matching an item of any of those patterns
+    _CUSTOM_DROPDOWN_ITEMS = (By.CSS_SELECTOR, ", ".join(_CUSTOM_DROPDOWN_SELECTORS))
+    
+    # Consent checkboxes rendered by Vue.js forms
+    _VUE_PRIVACY_SELECTORS = (
+        "[data-v-41ea0579][type='checkbox'][name='checkbox']",
+        "input.label-container__field.custom-checkbox[type='checkbox']"
+    )
+    
+    def __init__(self, driver, timeout=10, field_timeout=5):
         """
         Initialize FormInteraction with a Selenium WebDriver
         
         :param driver: Selenium WebDriver instance
         :param timeout: Maximum wait time for element interactions
+        :param field_timeout: Maximum wait for a single form field to appear; crawled
+                              XPaths are often stale, so this stays short
         """
         self.driver = driver
         self.timeout = timeout
+        self.field_timeout = field_timeout
+        
+        # Recently located elements, keyed by locator, in least-recently-used order
+        self._element_cache = OrderedDict()
+        
+        # Short, fast-polling wait reused by _wait for the common already-ready case
+        self._fast_wait = WebDriverWait(driver, 1, poll_frequency=0.05)
+        
+        # Implicit wait currently set on the driver. It stays off so explicit waits and
+        # probes for optional elements return immediately; field lookups turn it on
+        # around themselves (see _implicit_wait) so the driver polls for them browser-side.
+        self._implicit_timeout = 0
+        self.driver.implicitly_wait(0)
+    
+    @contextmanager
+    def _implicit_wait(self, seconds):
+        """
+        Temporarily change the driver's implicit wait, restoring the previous one after
+        
+        Only lookups of fields that are expected to appear should run with an
+        implicit wait, so it doesn't compound with explicit waits or slow down
+        probes for optional elements.
+        
+        :param seconds: Implicit wait to use inside the block
+        """
+        previous = self._implicit_timeout
+        self.driver.implicitly_wait(seconds)
+        self._implicit_timeout = seconds
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(previous)
+            self._implicit_timeout = previous
+    
+    @staticmethod
+    def _locator(field_info):
+        """
+        Pick the cheapest locator available for a field
+        
+        getElementById and querySelector resolve much faster than XPath
+        evaluation, so an 'id' or 'css' key in the field data wins over 'xpath'.
+        
+        :param field_info: Field dictionary from the form entry
+        :return: (By strategy, selector) tuple
+        """
+        if field_info.get('id'):
+            return (By.ID, field_info['id'])
+        if field_info.get('css'):
+            return (By.CSS_SELECTOR, field_info['css'])
+        return (By.XPATH, field_info.get('xpath', ''))
+    
+    def _resolve(self, locator, find=None):
+        """
+        Locate an element, reusing a cached reference while it is still attached
+        
+        :param locator: (By strategy, selector) tuple, used as the cache key
+        :param find: Callable that locates the element on a cache miss
+                     (defaults to driver.find_element with the locator)
+        :return: WebElement
+        """
+        element = self._element_cache.get(locator)
+        if element is not None:
+            try:
+                # Cheap liveness check; raises once the page has changed
+                element.is_enabled()
+                self._element_cache.move_to_end(locator)
+                return element
+            except StaleElementReferenceException:
+                del self._element_cache[locator]
+        
+        element = find() if find else self.driver.find_element(*locator)
+        self._remember(locator, element)
+        return element
+    
+    def _retry_stale(self, locator, element, action, attempts=3):
+        """
+        Run an action on an element, locating it again if the page replaced it meanwhile
+        
+        :param locator: (By strategy, selector) tuple the element was found with
+        :param element: WebElement to act on
+        :param action: Callable taking the element
+        :param attempts: Maximum number of tries
+        :return: Whatever the action returns
+        """
+        for attempt in range(attempts):
+            try:
+                return action(element)
+            except StaleElementReferenceException:
+                if attempt == attempts - 1:
+                    raise
+                logger.info("Element at %s went stale, locating it again", locator[1])
+                self._element_cache.pop(locator, None)
+                with self._implicit_wait(self.field_timeout):
+                    element = self._resolve(locator)
+    
+    def _remember(self, locator, element):
+        """
+        Add an element to the cache, evicting the least recently used one if full
+        
+        :param locator: (By strategy, selector) tuple
+        :param element: WebElement found with that locator
+        """
+        self._element_cache[locator] = element
+        self._element_cache.move_to_end(locator)
+        if len(self._element_cache) > _ELEMENT_CACHE_SIZE:
+            self._element_cache.popitem(last=False)
+    
+    def _batch_resolve(self, locators):
+        """
+        Locate several elements with a single script call
+        
+        The tag name and whether the element is visible and enabled come back
+        with each element, so callers don't need extra round-trips for them.
+        
+        :param locators: List of (By strategy, selector) tuples
+        :return: Dictionary of locator -> (WebElement, lowercased tag name, interactable)
+                 for the elements currently in the DOM
+        """
+        if not locators:
+            return {}
+        
+        try:
+            found = self.driver.execute_script(_BATCH_FIND_JS, [list(locator) for locator in locators])
+        except Exception as e:
+            logger.warning("Batch element lookup failed: %s", e)
+            return {}
+        
+        results = {}
+        for locator, match in zip(locators, found):
+            if match is not None:
+                self._remember(locator, match[0])
+                results[locator] = tuple(match)
+        return results
+    
+    def _bulk_fill(self, items):
+        """
+        Fill several plain text fields with a single script call
+        
+        :param items: List of (locator, value) pairs
+        :return: List with, per item, 'filled', 'missing', 'skipped' or 'rejected'
+                 (see _BULK_FILL_JS), or None for every item if the script failed
+        """
+        try:
+            return self.driver.execute_script(
+                _BULK_FILL_JS, [[*locator, str(value)] for locator, value in items]
+            )
+        except Exception as e:
+            logger.warning("Bulk fill failed, filling fields one by one: %s", e)
+            return [None] * len(items)
+    
+    def _js_set(self, element, value):
+        """
+        Set a field's value via JavaScript and fire input/change events
+        
+        :param element: Text input or textarea element
+        :param value: Value to set
+        :return: True if the field holds the value after the events have fired, False if
+                 it didn't or the element isn't an enabled, writable text control
+        """
+        return bool(self.driver.execute_script(_SET_VALUE_JS, element, value))
+    
+    def _fill_text(self, element, value, element_type=''):
+        """
+        Replace the value of a text field
+        
+        Plain fields are set in a single script call; types listed in
+        _KEYSTROKE_TYPES, and fields whose value didn't stick after the
+        script (input masks, custom key handlers), are cleared and typed into.
+        
+        :param element: Field element
+        :param value: Value to enter
+        :param element_type: Declared field type from the form entry
+        """
+        if element_type not in _KEYSTROKE_TYPES:
+            try:
+                if self._js_set(element, value):
+                    return
+                logger.info("Script could not set value, typing it instead")
+            except Exception as e:
+                logger.warning("Script fill failed, typing value instead: %s", e)
+        
+        try:
+            element.clear()
+        except ElementNotInteractableException:
+            # Present but not ready yet; wait for it once and retry
+            self._wait(EC.element_to_be_clickable(element))
+            element.clear()
+        element.send_keys(value)
+    
+    def _wait(self, condition, timeout=5):
+        """
+        Explicit wait that polls quickly first, then falls back to a normal wait
+        
+        Most elements are ready immediately or within a few hundred ms, so a
+        short 50 ms polling window answers those without sitting out a 0.5 s
+        poll interval; slower elements still get the full timeout.
+        
+        :param condition: Expected condition or callable taking the driver
+        :param timeout: Timeout of the fallback wait in seconds
+        :return: Whatever the condition returns
+        """
+        try:
+            return self._fast_wait.until(condition)
+        except TimeoutException:
+            return WebDriverWait(self.driver, timeout).until(condition)
+    
+    def _wait_for_dom_ready(self, timeout=3):
+        """
+        Wait until the document has been parsed, without waiting on sub-resources
+        
+        :param timeout: Maximum wait time in seconds
+        """
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                lambda d: d.execute_script("return document.readyState") != 'loading'
+            )
+        except TimeoutException:
+            logger.warning("DOM still loading, continuing anyway")
     
     def process_form(self, entry, user_data):
         """
@@ -43,172 +504,244 @@ class FormInteraction:
                 # Wait for the first element in the form to be ready before proceeding
                 first_field = next((f for f in entry.get('fields', {}).values() if f.get('xpath')), None)
                 if first_field and first_field.get('xpath'):
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.XPATH, first_field['xpath']))
+                    self._wait(
+                        EC.presence_of_element_located((By.XPATH, first_field['xpath'])), 10
                     )
                     logger.info("Form is loaded and ready for interaction.")
                 else:
-                    # Fallback to static delay if no fields with XPath are found
-                    logger.info("No field XPaths found, using static delay...")
-                    time.sleep(3)
+                    # Fallback to waiting for the DOM if no fields with XPath are found
+                    logger.info("No field XPaths found, waiting for the DOM to be ready...")
+                    self._wait_for_dom_ready()
             except Exception as e:
-                logger.warning(f"Wait for form load failed, using static delay: {e}")
-                time.sleep(3)
+                logger.warning("Wait for form load failed, waiting for the DOM to be ready: %s", e)
+                self._wait_for_dom_ready()
 
             # Process standard fields
             filled_fields = []
             
-            # Field name mapping for alternate field names
-            field_mappings = {
-                'Street': ['Street', 'StreetAddress', 'Address', 'AddressLine1', 'addr1'],
-                'StreetAddress': ['Street', 'StreetAddress', 'Address', 'AddressLine1', 'addr1'],
-                'Address': ['Street', 'StreetAddress', 'Address', 'AddressLine1', 'addr1'],
-                'Email': ['Email', 'EmailAddress', 'email_address'],
-                'ConfirmEmail': ['ConfirmEmail', 'EmailConfirm', 'email_confirm', 'verify_email'],
-                'Phone': ['Phone', 'Telephone', 'PhoneNumber', 'phone_number', 'Mobile'],
-                'City': ['City', 'Town', 'city_name'],
-                'Zipcode': ['Zipcode', 'ZipCode', 'PostalCode', 'Zip', 'postal_code', 'zip_code'],
-                'State': ['State', 'Province', 'Region', 'state_province'],
-                'Country': ['Country', 'Nation', 'United States', 'USA', 'US', 'United States of America'],
-                'Brochure': ['Brochure', 'BrochureRequest', 'RequestType', 'request', "Request a Brochure"],
-                'Privacy': ['Privacy', 'PrivacyOption', 'DeliveryMethod', 'ContactPreference', 'Email', 'SendBy']
-            }
+            # Match additional field names against all user data keys in one regex pass
+            # (longest keys first so the most specific key wins)
+            user_data_lower_items = tuple((key.lower(), key, value) for key, value in user_data.items())
+            lowered_keys = {key_lower: key for key_lower, key, _ in user_data_lower_items}
+            key_pattern = re.compile(
+                '|'.join(map(re.escape, sorted(lowered_keys, key=len, reverse=True)))
+            ) if lowered_keys else None
             
-            for field_name, field_info in entry.get('fields', {}).items():
-                # Skip Submit button
-                # Inside the process_form method in FormInteraction class
-                if field_name == 'Submit':
-                    # Log submit button location
-                    submit_xpath = field_info.get('xpath', '')
-                    if submit_xpath:
-                        try:
-                            # Check if the submit button exists on the page
-                            submit_element = self.driver.find_element(By.XPATH, submit_xpath)
-                            if submit_element:
-                                logger.info(f"Submit button found at XPath: {submit_xpath}")
-                            else:
-                                logger.info("Submit button not found (element reference is None)")
-                        except NoSuchElementException:
-                            logger.info(f"Submit button NOT found at XPath: {submit_xpath}")
-                        continue
-                    else:
-                        logger.info("Submit button XPath not provided")
-
-                
-                
-                # Check if this field is in our user data
-                user_value = None
-                
-                # Direct match
-                if field_name in user_data:
-                    user_value = user_data[field_name]
+            # Alternate-name patterns of the user data keys present, in FIELD_MAPPINGS order
+            alias_patterns = tuple((key, pattern) for key, pattern in _ALIAS_PATTERNS if key in user_data)
+            
+            # (lowercased name, user data key, value) candidates for matching a partial field
+            # name: the user data keys first, then the alternate names of keys present
+            candidates = user_data_lower_items + tuple(
+                (alias, user_key, user_data[user_key]) for alias, user_key in _LOWER_ALIASES if user_key in user_data
+            )
+            
+            fields = entry.get('fields', {})
+            
+            # Log submit button location
+            if 'Submit' in fields:
+                submit_xpath = fields['Submit'].get('xpath', '')
+                if submit_xpath:
+                    try:
+                        # Check if the submit button exists on the page
+                        submit_element = self.driver.find_element(By.XPATH, submit_xpath)
+                        if submit_element:
+                            logger.info("Submit button found at XPath: %s", submit_xpath)
+                        else:
+                            logger.info("Submit button not found (element reference is None)")
+                    except NoSuchElementException:
+                        logger.info("Submit button NOT found at XPath: %s", submit_xpath)
                 else:
-                    # Try alternate field names
-                    for user_key, possible_fields in field_mappings.items():
-                        if field_name in possible_fields and user_key in user_data:
-                            user_value = user_data[user_key]
-                            logger.info(f"Using {user_key} value for field {field_name}")
-                            break
-                
-                if user_value is None:
-                    continue
-                
-                # Get XPath
-                xpath = field_info.get('xpath', '')
-                if not xpath:
-                    logger.warning(f"No XPath found for {field_name}")
-                    continue
-                
+                    logger.info("Submit button XPath not provided")
+            
+            # Only visit fields that have an XPath and a value, directly or via an alternate name
+            # (name, field info, xpath, locator, value), with each field's locator built once
+            work = [
+                (name, info, info['xpath'], self._locator(info), value) for name, info in fields.items()
+                if name != 'Submit' and info.get('xpath')
+                and (value := _resolve_value(name, user_data)) is not None
+            ]
+            
+            # Fields that go through the per-element WebDriver path
+            element_fields = []
+            # Plain text fields that are filled together in one script call
+            bulk_fields = []
+            
+            for field_name, field_info, xpath, locator, user_value in work:
+                # Radio buttons, dropdowns and checkboxes need option matching or clicks,
+                # and masked inputs need real keystrokes
+                if field_info.get('type', '').lower() in ('radio', 'select', 'checkbox') + _KEYSTROKE_TYPES:
+                    element_fields.append((field_name, field_info, xpath, locator, user_value))
+                else:
+                    bulk_fields.append((field_name, field_info, xpath, locator, user_value))
+            
+            # Fill all plain text fields in a single round-trip
+            if bulk_fields:
+                results = self._bulk_fill([(locator, user_value) for _, _, _, locator, user_value in bulk_fields])
+                for bulk_field, result in zip(bulk_fields, results):
+                    if result == 'filled':
+                        filled_fields.append(bulk_field[0])
+                        logger.info("Filled %s with value: %s", bulk_field[0], bulk_field[4])
+                    else:
+                        # Not rendered yet, not a text control or the value didn't stick;
+                        # retry through WebDriver
+                        element_fields.append(bulk_field)
+            
+            # Elements resolved during this call as (element, tag name, interactable), by
+            # locator; alternate names (Street, StreetAddress, Address...) often point at
+            # the same element. The tag name and interactable flag are None when they weren't
+            # fetched with the element.
+            resolved = {}
+            
+            # Look up the remaining fields in one round-trip, each distinct locator once
+            resolved.update(self._batch_resolve(list(dict.fromkeys(
+                locator for _, _, _, locator, _ in element_fields
+            ))))
+            
+            for field_name, field_info, xpath, locator, user_value in element_fields:
                 try:
-                    # Find the element
-                    element = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, xpath))
-                    )
+                    # Fall back to a per-field lookup (the implicit wait covers slow-rendering fields)
+                    if locator not in resolved:
+                        with self._implicit_wait(self.field_timeout):
+                            resolved[locator] = (self._resolve(locator), None, None)
+                    element, tag_name, interactable = resolved[locator]
                     
                     # Handle different input types
                     element_type = field_info.get('type', '').lower()
                     if element_type == 'radio':
                         # Special handling for radio buttons
                         self.handle_radio_button(xpath, user_value)
-                    elif element_type == 'select' or element.tag_name.lower() == 'select':
-                        self.handle_dropdown(element, user_value)
+                    elif element_type == 'select' or tag_name == 'select' or (
+                        # Only ask the driver for the tag when the entry doesn't give a type
+                        tag_name is None and not element_type and element.tag_name.lower() == 'select'
+                    ):
+                        self._retry_stale(locator, element, lambda el: self.handle_dropdown(el, user_value))
                     elif element_type == 'checkbox' and isinstance(user_value, bool):
                         # Handle boolean checkbox values
                         self.select_checkbox_by_xpath(xpath, field_name)
                     else:
-                        # Clear existing value and input new value
-                        element.clear()
-                        element.send_keys(str(user_value))
+                        # Hidden or disabled (or not checked yet); give it a moment, but never
+                        # write into a field the user couldn't, such as a honeypot
+                        if not interactable:
+                            try:
+                                self._wait(EC.element_to_be_clickable(element))
+                            except TimeoutException:
+                                logger.warning("Skipping %s: field is hidden or disabled", field_name)
+                                continue
+                        # Replace existing value with the new value
+                        self._retry_stale(
+                            locator, element, lambda el: self._fill_text(el, str(user_value), element_type)
+                        )
                     
                     filled_fields.append(field_name)
-                    logger.info(f"Filled {field_name} with value: {user_value}")
+                    logger.info("Filled %s with value: %s", field_name, user_value)
                 
                 except (TimeoutException, NoSuchElementException):
-                    logger.warning(f"Could not find element for {field_name}")
+                    logger.warning("Could not find element for %s", field_name)
                 except Exception as e:
-                    logger.error(f"Error filling {field_name}: {str(e)}")
+                    logger.error("Error filling %s: %s", field_name, e)
             
-            # Process additional required fields
+            # Match additional required fields against the user data
+            additional_work = []
             for additional_field in entry.get('additional_fields', []):
-                try:
-                    field_name = additional_field.get('field_name', '').lower()
-                    xpath = additional_field.get('xpath', '')
-                    element_type = additional_field.get('element_type', '').lower()
-                    
-                    # Skip if no xpath
-                    if not xpath:
-                        continue
-                    
-                    # Check if the additional field name matches any of our keys using more flexible matching
-                    matching_key = None
-                    matching_value = None
-                    
-                    # Try direct user data keys first
-                    for key, value in user_data.items():
-                        key_lower = key.lower()
-                        if key_lower in field_name or field_name in key_lower:
-                            matching_key = key
-                            matching_value = value
-                            break
-                    
-                    # If no direct match, try the alternate field names
-                    if not matching_key:
-                        for user_key, possible_fields in field_mappings.items():
-                            if user_key in user_data:
-                                for possible_field in possible_fields:
-                                    if possible_field.lower() in field_name or field_name in possible_field.lower():
-                                        matching_key = user_key
-                                        matching_value = user_data[user_key]
-                                        break
-                                if matching_key:
-                                    break
-                    
-                    if not matching_key:
-                        continue
-                    
-                    # Find element
-                    element = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, xpath))
+                field_name = additional_field.get('field_name', '').lower()
+                xpath = additional_field.get('xpath', '')
+                element_type = additional_field.get('element_type', '').lower()
+                
+                # Skip if no xpath
+                if not xpath:
+                    continue
+                
+                # Check if the additional field name matches any of our keys using more flexible matching:
+                # try a user data key contained in the field name first...
+                key_match = key_pattern.search(field_name) if key_pattern else None
+                if key_match:
+                    matching_key = lowered_keys[key_match.group(0)]
+                else:
+                    # ...then an exact alternate name, which is a single dict hit
+                    matching_key = next(
+                        (key for key in _ALIAS_TO_CANONICAL.get(field_name, ()) if key in user_data), None
                     )
+                if not matching_key:
+                    # ...then an alternate name contained in the field name, one regex scan per key...
+                    matching_key = next(
+                        (key for key, pattern in alias_patterns if pattern.search(field_name)), None
+                    )
+                if matching_key:
+                    matching_value = user_data[matching_key]
+                else:
+                    # ...then the field name contained in a key or alternate name
+                    matching_key, matching_value = next(
+                        ((key, value) for name, key, value in candidates if field_name in name),
+                        (None, None)
+                    )
+                
+                if not matching_key:
+                    continue
+                
+                additional_work.append(
+                    (field_name, additional_field, xpath, element_type, self._locator(additional_field), matching_value)
+                )
+            
+            # Fill the plain text ones in a single round-trip, like the standard fields
+            bulk_indices = [
+                index for index, item in enumerate(additional_work)
+                if item[3] not in ('radio', 'select', 'checkbox') + _KEYSTROKE_TYPES
+            ]
+            bulk_filled = set()
+            if bulk_indices:
+                results = self._bulk_fill([additional_work[index][4:] for index in bulk_indices])
+                bulk_filled = {index for index, result in zip(bulk_indices, results) if result == 'filled'}
+            
+            # Look up the rest in one round-trip, skipping elements already resolved
+            resolved.update(self._batch_resolve(list(dict.fromkeys(
+                item[4] for index, item in enumerate(additional_work)
+                if index not in bulk_filled and item[4] not in resolved
+            ))))
+            
+            for index, (field_name, additional_field, xpath, element_type, locator, matching_value) in enumerate(additional_work):
+                if index in bulk_filled:
+                    filled_fields.append(field_name)
+                    logger.info("Filled additional field %s with value: %s", field_name, matching_value)
+                    continue
+                
+                try:
+                    # Find element, reusing one already resolved during this call
+                    if locator not in resolved:
+                        with self._implicit_wait(self.field_timeout):
+                            resolved[locator] = (self._resolve(locator), None, None)
+                    element, tag_name, interactable = resolved[locator]
                     
                     # Handle based on element type
-                    if element_type == 'select' or element.tag_name.lower() == 'select':
-                        self.handle_dropdown(element, matching_value)
+                    if element_type == 'select' or tag_name == 'select' or (
+                        # Only ask the driver for the tag when the entry doesn't give a type
+                        tag_name is None and not element_type and element.tag_name.lower() == 'select'
+                    ):
+                        self._retry_stale(locator, element, lambda el: self.handle_dropdown(el, matching_value))
                     elif element_type == 'checkbox' and isinstance(matching_value, bool):
                         # Handle boolean checkbox values
                         self.select_checkbox_by_xpath(xpath, field_name)
                     else:
-                        # Clear and input value
-                        element.clear()
-                        element.send_keys(str(matching_value))
+                        # Hidden or disabled (or not checked yet); give it a moment, but never
+                        # write into a field the user couldn't, such as a honeypot
+                        if not interactable:
+                            try:
+                                self._wait(EC.element_to_be_clickable(element))
+                            except TimeoutException:
+                                logger.warning("Skipping additional field %s: field is hidden or disabled", field_name)
+                                continue
+                        # Replace existing value with the new value
+                        self._retry_stale(
+                            locator, element, lambda el: self._fill_text(el, str(matching_value), element_type)
+                        )
                     
                     filled_fields.append(field_name)
-                    logger.info(f"Filled additional field {field_name} with value: {matching_value}")
+                    logger.info("Filled additional field %s with value: %s", field_name, matching_value)
                 
                 except (TimeoutException, NoSuchElementException):
-                    logger.warning(f"Could not find additional field: {additional_field}")
+                    logger.warning("Could not find additional field: %s", additional_field)
                 except Exception as e:
-                    logger.error(f"Error filling additional field: {str(e)}")
+                    logger.error("Error filling additional field: %s", e)
             
             # Handle privacy checkboxes if needed
             self.handle_privacy_field(entry)
@@ -238,7 +771,7 @@ class FormInteraction:
             return len(filled_fields) > 0
         
         except Exception as e:
-            logger.error(f"Unexpected error processing form: {e}")
+            logger.error("Unexpected error processing form: %s", e)
             return False
     
     def handle_dropdown(self, element, value):
@@ -249,139 +782,81 @@ class FormInteraction:
         :param value: The value to select
         """
         try:
-            # Standard Select approach
-            select = Select(element)
-            
-            # Strategy 1: Try to select by visible text
-            try:
-                select.select_by_visible_text(str(value))
-                logger.info(f"Selected dropdown option by visible text: {value}")
-                return
-            except Exception:
-                pass
+            # Standard <select>: pick and set the option in-page with one round-trip
+            selection = self.driver.execute_script(_DROPDOWN_JS, element, str(value))
+            if selection is None:
+                raise UnexpectedTagNameException("Dropdown element is not a <select>")
             
-            # Strategy 2: Try to select by value
-            try:
-                select.select_by_value(str(value))
-                logger.info(f"Selected dropdown option by value: {value}")
-                return
-            except Exception:
-                pass
-            
-            # Strategy 3: Find partial text match
-            try:
-                options = select.options
-                for option in options:
-                    option_text = option.text.lower()
-                    if str(value).lower() in option_text:
-                        select.select_by_visible_text(option.text)
-                        logger.info(f"Selected dropdown option by partial text match: {option.text}")
-                        return
-            except Exception:
-                pass
-            
-            # # Strategy 4: Select first non-empty option as fallback
-            # try:
-            #     options = select.options
-            #     for option in options:
-            #         if option.text.strip() and not option.text.lower() in ['select', 'choose', 'pick', '---']:
-            #             select.select_by_visible_text(option.text)
-            #             logger.info(f"Selected first valid dropdown option as fallback: {option.text}")
-            #             return
-            # except Exception:
-            #     pass
-            
-            # Strategy 5: Select last option as fallback
-            try:
-                options = select.options
-                if options:
-                    # Select the last non-placeholder option
-                    last_valid_option = None
-                    for option in reversed(options):
-                        if option.text.strip() and not option.text.lower() in ['select', 'choose', 'pick', '---']:
-                            last_valid_option = option
-                            break
-                    
-                    if last_valid_option:
-                        select.select_by_visible_text(last_valid_option.text)
-                        logger.info(f"Selected last valid dropdown option as fallback: {last_valid_option.text}")
-                        return
-            except Exception:
-                pass
-                
-            # Strategy 6: Select by index as last resort
-            try:
-                select.select_by_index(1)  # Usually index 0 is the placeholder
-                logger.info("Selected dropdown option by index 1")
-                return
-            except Exception:
-                pass
-                
+            if selection:
+                logger.info("Selected dropdown option by %s: %s", selection['strategy'], selection['text'])
+            else:
+                logger.warning("No selectable dropdown option found for value: %s", value)
+            return
+        
+        except StaleElementReferenceException:
+            # Let the caller locate the dropdown again
+            raise
         except Exception as e:
-            logger.warning(f"Standard dropdown selection failed: {e}")
+            logger.warning("Standard dropdown selection failed: %s", e)
             
             # Handle non-standard dropdowns (custom dropdowns using divs/spans)
             try:
-                # Click to open the dropdown
-                ActionChains(self.driver).move_to_element(element).click().perform()
-                time.sleep(0.5)
-                
-                # Find dropdown items
-                dropdown_items = None
-                
-                # Try various common patterns for custom dropdowns
-                selectors = [
-                    f"//ul[contains(@class, 'dropdown')]/li",
-                    f"//div[contains(@class, 'dropdown')]/div",
-                    f"//div[contains(@class, 'select')]/div",
-                    f"//div[contains(@class, 'option')]",
-                    f"//li[contains(@class, 'option')]",
-                    f"//div[contains(@role, 'option')]"
-                ]
+                # Click to open the dropdown (via script if something overlays it), then wait for
+                # items matching any of the common custom dropdown patterns with a single selector
+                # list instead of one wait per pattern
+                try:
+                    element.click()
+                except (ElementNotInteractableException, ElementClickInterceptedException):
+                    self.driver.execute_script("arguments[0].click();", element)
+                try:
+                    self._wait(EC.presence_of_element_located(self._CUSTOM_DROPDOWN_ITEMS), 2)
+                except TimeoutException:
+                    pass
+                time.sleep(0.05)  # Let CSS open transitions settle
                 
-                for selector in selectors:
-                    try:
-                        dropdown_items = WebDriverWait(self.driver, 2).until(
-                            EC.presence_of_all_elements_located((By.XPATH, selector))
-                        )
-                        if dropdown_items:
-                            break
-                    except:
-                        continue
+                # Find dropdown items: those of the first pattern that matches anything
+                dropdown_items = self.driver.execute_script(_FIRST_SELECTOR_MATCHES_JS, self._CUSTOM_DROPDOWN_SELECTORS)
                 
                 if dropdown_items:
+                    # Read every item's visible text in one round-trip instead of one per item
+                    item_texts = self.driver.execute_script(
+                        "return arguments[0].map(function (e) { return (e.innerText || '').trim(); });",
+                        dropdown_items
+                    )
+                    lower_texts = [text.lower() for text in item_texts]
+                    value_lower = str(value).lower()
+                    
                     # Strategy 1: Try to find exact text match
-                    for item in dropdown_items:
-                        if str(value).lower() == item.text.lower():
+                    for item, text, text_lower in zip(dropdown_items, item_texts, lower_texts):
+                        if value_lower == text_lower:
                             item.click()
-                            logger.info(f"Selected custom dropdown option by exact match: {item.text}")
+                            logger.info("Selected custom dropdown option by exact match: %s", text)
                             return
                     
                     # Strategy 2: Try to find partial text match
-                    for item in dropdown_items:
-                        if str(value).lower() in item.text.lower():
+                    for item, text, text_lower in zip(dropdown_items, item_texts, lower_texts):
+                        if value_lower in text_lower:
                             item.click()
-                            logger.info(f"Selected custom dropdown option by partial match: {item.text}")
+                            logger.info("Selected custom dropdown option by partial match: %s", text)
                             return
                     
                     # Strategy 3: Select last item as fallback
-                    if len(dropdown_items) > 0:
-                        last_valid_item = None
-                        for item in reversed(dropdown_items):
-                            if item.text.strip() and not item.text.lower() in ['select', 'choose', 'pick', '---']:
-                                last_valid_item = item
-                                break
-                        
-                        if last_valid_item:
-                            last_valid_item.click()
-                            logger.info(f"Selected last valid custom dropdown option as fallback: {last_valid_item.text}")
-                        else:
-                            # If no valid item found, select the last item
-                            dropdown_items[-1].click()
-                            logger.info(f"Selected last custom dropdown option as fallback: {dropdown_items[-1].text}")
-                        return
+                    last_valid_index = next(
+                        (i for i in reversed(range(len(dropdown_items)))
+                         if item_texts[i] and lower_texts[i] not in ['select', 'choose', 'pick', '---']),
+                        None
+                    )
+                    
+                    if last_valid_index is not None:
+                        dropdown_items[last_valid_index].click()
+                        logger.info("Selected last valid custom dropdown option as fallback: %s", item_texts[last_valid_index])
+                    else:
+                        # If no valid item found, select the last item
+                        dropdown_items[-1].click()
+                        logger.info("Selected last custom dropdown option as fallback: %s", item_texts[-1])
+                    return
             except Exception as e:
-                logger.warning(f"Custom dropdown selection failed: {e}")
+                logger.warning("Custom dropdown selection failed: %s", e)
     
     def handle_privacy_field(self, entry):
         """
@@ -390,26 +865,27 @@ class FormInteraction:
         :param entry: Dictionary containing form entry data
         """
         try:
-            # Vue.js specific detection strategy
-            vue_privacy_selectors = [
-                "[data-v-41ea0579][type='checkbox'][name='checkbox']",
-                "input.label-container__field.custom-checkbox[type='checkbox']"
-            ]
-            
-            element = None
-            for selector in vue_privacy_selectors:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    break  # Stop if element is found
-                except NoSuchElementException:
-                    continue
+            # Vue.js specific detection strategy: probe all the selectors in one round-trip
+            # instead of a raising find_element each
+            element = self.driver.execute_script(
+                "for (var i = 0; i < arguments[0].length; i++) {"
+                "    var el = document.querySelector(arguments[0][i]);"
+                "    if (el) return el;"
+                "}"
+                "return null;",
+                self._VUE_PRIVACY_SELECTORS
+            )
             
             # If no Vue.js element found, fall back to original method
             if element is None:
                 # Original privacy field finding logic
                 privacy_info = entry.get('fields', {}).get('Privacy', {})
                 
-                if privacy_info and privacy_info.get('found', False):
+                # Nothing to do on pages without a consent checkbox
+                if not privacy_info:
+                    return
+                
+                if privacy_info.get('found', False):
                     xpath = privacy_info.get('xpath', '')
                     if not xpath:
                         return
@@ -417,15 +893,15 @@ class FormInteraction:
                     # Extract the ID from xpath if possible
                     checkbox_id = None
                     if 'id=' in xpath:
-                        id_match = re.search(r'id=[\'"]([^\'"]+)[\'"]', xpath)
+                        id_match = _ID_IN_XPATH.search(xpath)
                         if id_match:
                             checkbox_id = id_match.group(1)
                     
                     # First try to find by xpath
                     try:
-                        element = WebDriverWait(self.driver, 3).until(
-                            EC.presence_of_element_located((By.XPATH, xpath))
-                        )
+                        element = self._resolve((By.XPATH, xpath), lambda: self._wait(
+                            EC.presence_of_element_located((By.XPATH, xpath)), 3
+                        ))
                     except Exception as xpath_error:
                         # If xpath fails and we have ID, try finding by ID directly
                         try:
@@ -435,7 +911,7 @@ class FormInteraction:
                                 logger.warning("Element not found by XPath and no ID available")
                                 return
                         except Exception as id_error:
-                            logger.warning(f"Error finding privacy checkbox: {id_error}")
+                            logger.warning("Error finding privacy checkbox: %s", id_error)
                             return
             
             # If still no element found, return
@@ -443,69 +919,36 @@ class FormInteraction:
                 logger.warning("No privacy checkbox found")
                 return
             
-            # Check if it's already selected
-            if element.get_attribute('type') == 'checkbox' and element.is_selected():
+            # Check if it's already selected, and scroll it into view if not, in one round-trip
+            state = self.driver.execute_script(_PRIVACY_STATE_JS, element)
+            if state['type'] == 'checkbox' and state['checked']:
                 logger.info("Privacy checkbox already selected")
                 return
             
-            # Make sure element is in view
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            time.sleep(0.5)  # Brief pause for scrolling
-            
-            # Multiple strategies to click the checkbox
-            strategies = [
-                # Strategy 1: Direct click on checkbox
-                lambda: element.click(),
-                
-                # Strategy 2: JavaScript click on checkbox
-                lambda: self.driver.execute_script("arguments[0].click();", element),
-                
-                # Strategy 3: Find and click the label if ID is available
-                lambda: (self.driver.find_element(By.XPATH, f"//label[@for='{checkbox_id}']").click()) 
-                        if 'checkbox_id' in locals() and checkbox_id else None,
-                
-                # Strategy 4: Click the frame/styled element nearby
-                lambda: self.driver.find_element(By.CSS_SELECTOR, 
-                                                f"#{checkbox_id} + .checkbox-frame, #{checkbox_id} ~ .nb-checkbox-frame, "
-                                                f"#{checkbox_id} + span, #{checkbox_id} ~ span.checkbox-frame").click() 
-                        if 'checkbox_id' in locals() and checkbox_id else None,
-                
-                # Strategy 5: Set checked property via JavaScript
-                lambda: self.driver.execute_script(
-                    f"document.getElementById('{checkbox_id}').checked = true;"
-                    f"document.getElementById('{checkbox_id}').dispatchEvent(new Event('change', {{bubbles: true}}));"
-                ) if 'checkbox_id' in locals() and checkbox_id else self.driver.execute_script(
-                    "arguments[0].checked = true; arguments[0].dispatchEvent(new Event('change', {bubbles: true}));", 
-                    element
-                ),
-                
-                # Strategy 6: Use parent node to click
-                lambda: self.driver.execute_script(
-                    "arguments[0].parentNode.click();", element
-                ),
-                
-                # Strategy 7: Find nearby span to click (for custom checkboxes)
-                lambda: self.driver.execute_script(
-                    "var spans = arguments[0].parentNode.querySelectorAll('span');"
-                    "if(spans.length > 0) spans[0].click();",
-                    element
-                )
-            ]
-            
-            # Try each strategy until one works
-            for i, strategy in enumerate(strategies):
+            # If it had to be scrolled, poll until scrolling has finished
+            if not state['inView']:
                 try:
-                    strategy()
-                    logger.info(f"Privacy checkbox clicked with strategy {i+1}")
-                    return
-                except Exception as strategy_error:
-                    logger.debug(f"Strategy {i+1} failed: {strategy_error}")
-                    continue
+                    self._fast_wait.until(
+                        lambda d: d.execute_script(
+                            "var r = arguments[0].getBoundingClientRect();"
+                            "return r.top >= 0 && r.bottom <= window.innerHeight;",
+                            element
+                        )
+                    )
+                except TimeoutException:
+                    pass
+                time.sleep(0.05)  # Let CSS transitions settle
+            
+            # Try every click strategy in-page, stopping at the first that checks the box
+            strategy = self.driver.execute_script(_PRIVACY_CLICK_JS, element)
+            if strategy:
+                logger.info("Privacy checkbox clicked with strategy: %s", strategy)
+                return
             
             logger.warning("All privacy checkbox interaction strategies failed")
         
         except Exception as e:
-            logger.warning(f"Error in privacy field handling: {e}")
+            logger.warning("Error in privacy field handling: %s", e)
 
     def select_checkbox_by_xpath(self, xpath, field_name='Checkbox'):
         """
@@ -515,28 +958,28 @@ class FormInteraction:
         :param field_name: Name of the field for logging purposes
         """
         try:
-            logger.info(f"Attempting to find checkbox for {field_name}")
-            logger.info(f"XPath: {xpath}")
+            logger.info("Attempting to find checkbox for %s", field_name)
+            logger.info("XPath: %s", xpath)
             
             # Detailed element search
             element = None
             try:
                 # 1. Standard WebDriverWait
-                element = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.XPATH, xpath))
-                )
+                element = self._resolve((By.XPATH, xpath), lambda: self._wait(
+                    EC.presence_of_element_located((By.XPATH, xpath)), 10
+                ))
                 logger.info("Found element via presence method")
             except Exception as e1:
-                logger.warning(f"Presence method failed: {e1}")
+                logger.warning("Presence method failed: %s", e1)
                 
                 try:
                     # 2. Visibility method
-                    element = WebDriverWait(self.driver, 10).until(
-                        EC.visibility_of_element_located((By.XPATH, xpath))
+                    element = self._wait(
+                        EC.visibility_of_element_located((By.XPATH, xpath)), 10
                     )
                     logger.info("Found element via visibility method")
                 except Exception as e2:
-                    logger.warning(f"Visibility method failed: {e2}")
+                    logger.warning("Visibility method failed: %s", e2)
                     
                     try:
                         # 3. JavaScript method
@@ -549,7 +992,7 @@ class FormInteraction:
                         else:
                             logger.warning("JavaScript method could not find the element")
                     except Exception as e3:
-                        logger.error(f"JavaScript method failed: {e3}")
+                        logger.error("JavaScript method failed: %s", e3)
                         return False
             
             # Interaction strategies
@@ -558,25 +1001,25 @@ class FormInteraction:
                     # 1. Try clicking the element directly
                     if hasattr(element, 'click'):
                         element.click()
-                        logger.info(f"Clicked {field_name} checkbox directly")
+                        logger.info("Clicked %s checkbox directly", field_name)
                         return True
                     elif element:
                         # If element was found via JavaScript
                         self.driver.execute_script("arguments[0].click();", element)
-                        logger.info(f"Clicked {field_name} checkbox via JavaScript")
+                        logger.info("Clicked %s checkbox via JavaScript", field_name)
                         return True
                 except Exception as click_error:
-                    logger.warning(f"Direct click failed: {click_error}")
+                    logger.warning("Direct click failed: %s", click_error)
                 
                 try:
                     # 2. Try finding and clicking the associated label
                     checkbox_id = element.get_attribute('id') if hasattr(element, 'get_attribute') else element.id
                     label = self.driver.find_element(By.XPATH, f"//label[@for='{checkbox_id}']")
                     label.click()
-                    logger.info(f"Clicked label for {field_name} checkbox")
+                    logger.info("Clicked label for %s checkbox", field_name)
                     return True
                 except Exception as label_error:
-                    logger.warning(f"Label click failed: {label_error}")
+                    logger.warning("Label click failed: %s", label_error)
                 
                 try:
                     # 3. JavaScript attribute setting
@@ -585,15 +1028,15 @@ class FormInteraction:
                         elem.checked = true;
                         elem.dispatchEvent(new Event('change', { bubbles: true }));
                     """, element)
-                    logger.info(f"Set checkbox state via JavaScript for {field_name}")
+                    logger.info("Set checkbox state via JavaScript for %s", field_name)
                     return True
                 except Exception as js_error:
-                    logger.error(f"JavaScript checkbox setting failed: {js_error}")
+                    logger.error("JavaScript checkbox setting failed: %s", js_error)
             
             return False
         
         except Exception as e:
-            logger.error(f"Comprehensive error in finding {field_name} checkbox: {e}")
+            logger.error("Comprehensive error in finding %s checkbox: %s", field_name, e)
             return False
         
     def handle_radio_button(self, xpath, value):
@@ -616,20 +1059,20 @@ class FormInteraction:
                         # Try to find and click the associated label
                         label = self.driver.find_element(By.XPATH, f"//label[@for='{element_id}']")
                         if label:
-                            logger.info(f"Clicking on label for radio button {element_id}")
+                            logger.info("Clicking on label for radio button %s", element_id)
                             label.click()
                             return
                 except Exception as e:
-                    logger.warning(f"Could not click on label, trying JavaScript click: {e}")
+                    logger.warning("Could not click on label, trying JavaScript click: %s", e)
                     
                 # If label click failed, try JavaScript click
                 try:
                     element = self.driver.find_element(By.XPATH, xpath)
                     self.driver.execute_script("arguments[0].click();", element)
-                    logger.info(f"Selected radio button at {xpath} using JavaScript click")
+                    logger.info("Selected radio button at %s using JavaScript click", xpath)
                     return
                 except Exception as js_error:
-                    logger.error(f"JavaScript click failed: {js_error}")
+                    logger.error("JavaScript click failed: %s", js_error)
                     
                 return
                 
@@ -644,12 +1087,12 @@ class FormInteraction:
                     try:
                         label = self.driver.find_element(By.XPATH, f"//label[@for='{element_id}']")
                         label.click()
-                        logger.info(f"Selected radio button by clicking label for {element_id}")
+                        logger.info("Selected radio button by clicking label for %s", element_id)
                         return
                     except Exception:
                         # Fallback to JavaScript click
                         self.driver.execute_script("arguments[0].click();", radio_element)
-                        logger.info(f"Selected radio button at {xpath} using JavaScript click")
+                        logger.info("Selected radio button at %s using JavaScript click", xpath)
                         return
                 
             # Find all radio buttons with the same name
@@ -665,12 +1108,12 @@ class FormInteraction:
                         if radio_id:
                             label = self.driver.find_element(By.XPATH, f"//label[@for='{radio_id}']")
                             label.click()
-                            logger.info(f"Selected radio button with value: {value} by clicking its label")
+                            logger.info("Selected radio button with value: %s by clicking its label", value)
                             return
                     except Exception:
                         # Fallback to JavaScript click
                         self.driver.execute_script("arguments[0].click();", radio)
-                        logger.info(f"Selected radio button with value: {value} using JavaScript click")
+                        logger.info("Selected radio button with value: %s using JavaScript click", value)
                         return
                     
                 # Try to find by label text
@@ -680,7 +1123,7 @@ class FormInteraction:
                         label = self.driver.find_element(By.XPATH, f"//label[@for='{radio_id}']")
                         if label.text.lower() == str(value).lower():
                             label.click()
-                            logger.info(f"Selected radio button with label text: {value}")
+                            logger.info("Selected radio button with label text: %s", value)
                             return
                 except Exception:
                     pass
@@ -693,13 +1136,81 @@ class FormInteraction:
                     if first_id:
                         first_label = self.driver.find_element(By.XPATH, f"//label[@for='{first_id}']")
                         first_label.click()
-                        logger.info(f"No matching radio button found for '{value}', selected first option via label")
+                        logger.info("No matching radio button found for '%s', selected first option via label", value)
                         return
                 except Exception:
                     # Fallback to JavaScript click on the first radio button
                     self.driver.execute_script("arguments[0].click();", radio_buttons[0])
-                    logger.info(f"No matching radio button found for '{value}', selected first option via JavaScript")
+                    logger.info("No matching radio button found for '%s', selected first option via JavaScript", value)
                     
         except Exception as e:
-            logger.error(f"Error in radio button handling: {str(e)}")
+            logger.error("Error in radio button handling: %s", e)
+
+
+
+class FormInteractionPool:
+    """
+    Runs process_form for many entries in parallel, one WebDriver session per worker
+
+    WebDriver calls spend their time waiting on the driver's socket, so plain
+    threads overlap them well. Each worker checks out a FormInteraction for the
+    duration of an entry, so a driver is never shared between two entries at
+    once and keeps its cookies/session between the entries it handles.
+
+    Entries are processed concurrently: each entry (and its 'fields' /
+    'additional_fields') must be local to that entry, and user_data is only
+    read, never modified.
+    """
 
+    def __init__(self, drivers, timeout=10):
+        """
+        Initialize the pool with already created drivers
+
+        :param drivers: Iterable of Selenium WebDriver instances, one per worker
+        :param timeout: Maximum wait time for element interactions
+        """
+        self.interactions = [FormInteraction(driver, timeout) for driver in drivers]
+        if not self.interactions:
+            raise ValueError("FormInteractionPool needs at least one driver")
+
+        # Idle FormInteraction instances
+        self._idle = queue.Queue()
+        for interaction in self.interactions:
+            self._idle.put(interaction)
+
+    def _process_entry(self, entry, user_data):
+        """
+        Load an entry's page on an idle driver and fill its form
+
+        :param entry: Dictionary containing form entry data
+        :param user_data: Dictionary of user data to fill form
+        :return: Boolean indicating success
+        """
+        interaction = self._idle.get()
+        try:
+            url = entry.get('url')
+            if url and interaction.driver.current_url != url:
+                interaction.driver.get(url)
+            elif url:
+                # Still on this page from the previous entry; clear what it filled in
+                interaction.driver.execute_script(
+                    "document.querySelectorAll('form').forEach(function (f) { f.reset(); });"
+                )
+            return interaction.process_form(entry, user_data)
+        except Exception as e:
+            logger.error("Error processing form %s: %s", entry.get('url'), e)
+            return False
+        finally:
+            self._idle.put(interaction)
+
+    def process_forms(self, entries, user_data):
+        """
+        Process form entries across all drivers in the pool
+
+        :param entries: Iterable of form entries
+        :param user_data: Dictionary of user data to fill form
+        :return: List of booleans indicating success, in entry order
+        """
+        with ThreadPoolExecutor(max_workers=len(self.interactions)) as executor:
+            futures = [executor.submit(self._process_entry, entry, user_data) for entry in entries]
+            return [future.result() for future in futures]
@@ -2,9 +2,10 @@ import json
 import logging
 import sys
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 
-from form_interaction import FormInteraction
+from browser_setup import configure_page_loading, get_chromedriver_path
+from form_interaction import FormInteractionPool
 
 # Configure logging
 logging.basicConfig(
@@ -17,17 +18,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def setup_browser():
+# Number of browsers filling forms in parallel
+POOL_SIZE = 2
+
+# Also block stylesheets when FORM_SUBMITTER_BLOCK_STYLESHEETS=1. Off by default: without
+# CSS, honeypot and off-screen fields that stylesheets hide become visible and get filled,
+# and some custom dropdowns stop opening
+BLOCK_STYLESHEETS = os.environ.get('FORM_SUBMITTER_BLOCK_STYLESHEETS') == '1'
+
+def setup_browser(block_stylesheets=BLOCK_STYLESHEETS):
     """
     Set up Chrome WebDriver with advanced configuration
     
+    :param block_stylesheets: Stop Chrome downloading stylesheets
     :return: Configured Selenium WebDriver
     """
     try:
         from selenium import webdriver
         from selenium.webdriver.chrome.service import Service
         from selenium.webdriver.chrome.options import Options
-        from webdriver_manager.chrome import ChromeDriverManager
 
         # Chrome options for stability and stealth
         chrome_options = Options()
@@ -42,14 +51,19 @@ def setup_browser():
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option("useAutomationExtension", False)
         
+        # Skip resources the form filling doesn't need and don't wait on sub-resources
+        configure_page_loading(chrome_options, block_stylesheets=block_stylesheets)
+        
         # Optional: Run in headless mode (uncomment if needed)
         # chrome_options.add_argument("--headless")
         
-        # Use WebDriver Manager to handle driver installation
-        service = Service(ChromeDriverManager().install())
-        
-        # Create driver with service and options
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        # Reuse a previously installed driver when possible
+        try:
+            driver = webdriver.Chrome(service=Service(get_chromedriver_path()), options=chrome_options)
+        except Exception as e:
+            # The cached driver may no longer match the installed Chrome
+            logger.warning("Cached ChromeDriver failed, reinstalling: %s", e)
+            driver = webdriver.Chrome(service=Service(get_chromedriver_path(refresh=True)), options=chrome_options)
         
         # Additional anti-detection script
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -57,83 +71,128 @@ def setup_browser():
         return driver
     
     except Exception as e:
-        logger.error(f"Error setting up browser: {e}")
+        logger.error("Error setting up browser: %s", e)
         raise
 
 def load_form_data(file_path):
     """
     Load form data from JSON file
     
+    Uses orjson's C parser when it is installed; every entry is needed up
+    front to spread the forms across the browser pool, so the file is
+    parsed in one go rather than streamed.
+    
     :param file_path: Path to the JSON file
     :return: Parsed JSON data
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            try:
+                import orjson
+            except ImportError:
+                return json.load(f)
+            
+            return orjson.loads(f.read())
     except Exception as e:
-        logger.error(f"Error loading form data: {e}")
+        logger.error("Error loading form data: %s", e)
         return []
 
-def process_forms(json_data, user_data):
+def filter_form_entries(json_data):
+    """
+    Drop form entries that can't be filled
+    
+    :param json_data: Iterable of form entries
+    :return: List of entries that have fields, a URL and no error
+    """
+    form_entries = []
+    for index, form_entry in enumerate(json_data, 1):
+        # Skip forms with errors or no fields
+        if form_entry.get('error') or not form_entry.get('fields'):
+            logger.warning("Skipping form %d due to error or no fields", index)
+            continue
+        
+        # Get URL
+        if not form_entry.get('url'):
+            logger.warning("No URL found for form %d", index)
+            continue
+        
+        form_entries.append(form_entry)
+    
+    return form_entries
+
+def form_signature(form_entry):
+    """
+    Identify a form by its URL and field names
+    
+    :param form_entry: Form entry from the JSON data
+    :return: Hashable (url, sorted field names) tuple
+    """
+    return (form_entry['url'], tuple(sorted(form_entry['fields'])))
+
+def process_forms(form_entries, user_data):
     """
     Process forms from JSON data
     
-    :param json_data: List of form entries
+    Forms are spread across POOL_SIZE browsers working in parallel. Entries
+    repeating an earlier form's URL and fields are filled only once and
+    reported with that form's result.
+    
+    :param form_entries: List of form entries, already filtered by filter_form_entries
     :param user_data: User data dictionary
     """
-    # Setup browser
-    driver = None
+    if not form_entries:
+        return
+    
+    # Map each signature to its first entry's position among the forms to fill
+    seen = {}
+    unique_entries = []
+    unique_numbers = []  # 1-based position of each unique entry in form_entries
+    for number, form_entry in enumerate(form_entries, 1):
+        sig = form_signature(form_entry)
+        if sig not in seen:
+            seen[sig] = len(unique_entries)
+            unique_entries.append(form_entry)
+            unique_numbers.append(number)
+    
+    # Setup browsers, starting them concurrently since each launch mostly waits on Chrome
+    drivers = []
     try:
-        driver = setup_browser()
+        browser_count = min(POOL_SIZE, len(unique_entries))
+        with ThreadPoolExecutor(max_workers=browser_count) as executor:
+            launches = [executor.submit(setup_browser) for _ in range(browser_count)]
+        for launch in launches:
+            try:
+                drivers.append(launch.result())
+            except Exception:
+                # Already logged by setup_browser; carry on with the browsers that started
+                pass
         
-        # Form interaction instance
-        form_interaction = FormInteraction(driver)
+        if not drivers:
+            logger.critical("No browser could be started")
+            return
         
-        # Process each form entry
-        for index, form_entry in enumerate(json_data, 1):
-            try:
-                # Skip forms with errors or no fields
-                if form_entry.get('error') or not form_entry.get('fields'):
-                    logger.warning(f"Skipping form {index} due to error or no fields")
-                    continue
-                
-                # Get URL
-                url = form_entry.get('url')
-                if not url:
-                    logger.warning(f"No URL found for form {index}")
-                    continue
-                
-                # Log current processing
-                logger.info(f"Processing form {index}/{len(json_data)}: {url}")
-                
-                # Navigate to URL
-                driver.get(url)
-                
-                # Wait for page to load
-                time.sleep(3)
-                
-                # Process the form
-                success = form_interaction.process_form(form_entry, user_data)
-                
-                # Log result
-                if success:
-                    logger.info(f"Successfully processed form: {url}")
-                else:
-                    logger.warning(f"Failed to process form: {url}")
-                
-                # Optional: Add delay between form submissions
-                time.sleep(8)
-            
-            except Exception as e:
-                logger.error(f"Error processing form {index}: {e}")
-                continue
+        # Each worker navigates to its entry's URL and fills the form
+        logger.info("Processing %d forms across %d browsers", len(unique_entries), len(drivers))
+        results = FormInteractionPool(drivers).process_forms(unique_entries, user_data)
+        
+        # Log results, reporting duplicates from their first occurrence
+        for form_entry in form_entries:
+            index = seen[form_signature(form_entry)]
+            success = results[index]
+            if form_entry is not unique_entries[index]:
+                logger.info("Duplicate of form %d (%s): %s", unique_numbers[index],
+                            "processed" if success else "failed", form_entry['url'])
+            elif success:
+                logger.info("Successfully processed form: %s", form_entry['url'])
+            else:
+                logger.warning("Failed to process form: %s", form_entry['url'])
     
     except Exception as e:
-        logger.critical(f"Critical error in form processing: {e}")
+        logger.critical("Critical error in form processing: %s", e)
     
     finally:
-        # Ensure driver is closed
-        if driver:
+        # Ensure drivers are closed
+        for driver in drivers:
             try:
                 driver.quit()
             except:
@@ -156,14 +215,19 @@ def main():
     
     # Validate input file exists
     if not os.path.exists(input_file):
-        logger.error(f"Input file not found: {input_file}")
+        logger.error("Input file not found: %s", input_file)
         sys.exit(1)
     
-    # Load form data
-    json_data = load_form_data(input_file)
+    # Load form data, keeping only the forms that can be filled
+    form_entries = filter_form_entries(load_form_data(input_file))
+    
+    # Don't start any browser if there is nothing to do
+    if not form_entries:
+        logger.warning("No fillable forms found")
+        return
     
     # Process forms
-    process_forms(json_data, user_data)
+    process_forms(form_entries, user_data)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file